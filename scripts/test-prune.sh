@@ -92,15 +92,15 @@ console.log('  dry-run deleted nothing; real prune removed 1 node + 1 session (+
 "
 
 # ── Scenario C: dedupe-skills ──────────────────────────────────────────────────
-echo "[prune] dedupe-skills: duplicate name collapses to newest, unique skill survives"
+echo "[prune] dedupe-skills: duplicate name collapses to most-used, unique skill survives"
 DB="$(fresh_home dedupe)"
 node -e "
 const D = require('$BSQ'); const db = new D('$DB');
 const OLD = new Date(Date.now() - 30*864e5).toISOString();
 const NEW = new Date(Date.now() - 1*864e5).toISOString();
 const skill = (id,name,date,uc) => db.prepare('INSERT INTO skills (id,name,category,created_date,success_rate,use_count,filepath) VALUES (?,?,?,?,?,?,?)').run(id,name,'general',date,1.0,uc,null);
-skill('K1','Deploy Flow',OLD,1);   // older duplicate -> removed
-skill('K2','deploy flow',NEW,5);   // newer duplicate -> kept
+skill('K1','Deploy Flow',OLD,1);   // less-used duplicate -> removed
+skill('K2','deploy flow',NEW,5);   // most-used duplicate -> kept
 skill('K3','Unique Skill',NEW,1);  // unique          -> kept
 db.close();
 "
@@ -116,7 +116,7 @@ if (real.dedupe.duplicateGroups !== 1 || real.dedupe.removed !== 1) fail('real d
 const ids = db.prepare('SELECT id FROM skills ORDER BY id').all().map(r => r.id);
 if (JSON.stringify(ids) !== JSON.stringify(['K2','K3'])) fail('survivors should be K2,K3; got ' + ids);
 db.close();
-console.log('  dry-run kept all 3; real prune removed older duplicate K1, kept K2 (newest) + K3');
+console.log('  dry-run kept all 3; real prune removed less-used duplicate K1, kept K2 (most-used) + K3');
 "
 
 # ── Scenario D: --all applies every default target in one pass ──────────────────
@@ -19,6 +19,66 @@ MEMORIA_HOME="$TMP_MEMORIA_HOME" "$ROOT_DIR/cli" init
 echo "[smoke] sync"
 MEMORIA_HOME="$TMP_MEMORIA_HOME" "$ROOT_DIR/cli" sync "$SESSION_FILE"
 
+echo "[smoke] batch sync (multiple session files in one invocation)"
+BATCH_A_FILE="$TMP_MEMORIA_HOME/batch-a-session.json"
+BATCH_B_FILE="$TMP_MEMORIA_HOME/batch-b-session.json"
+cat > "$BATCH_A_FILE" <<'JSON'
+{
+  "id": "session_batch_001",
+  "timestamp": "2026-03-17T09:00:00Z",
+  "project": "Memoria",
+  "summary": "Batch import session A exercises the bulk sync path",
+  "events": [
+    {
+      "timestamp": "2026-03-17T09:00:01Z",
+      "type": "UserMessage",
+      "content": { "text": "First session of the batch" },
+      "metadata": { "channel": "cli" }
+    }
+  ]
+}
+JSON
+cat > "$BATCH_B_FILE" <<'JSON'
+{
+  "id": "session_batch_002",
+  "timestamp": "2026-03-17T09:05:00Z",
+  "project": "Memoria",
+  "summary": "Batch import session B rides the same invocation",
+  "events": [
+    {
+      "timestamp": "2026-03-17T09:05:01Z",
+      "type": "UserMessage",
+      "content": { "text": "Second session of the batch" },
+      "metadata": { "channel": "cli" }
+    }
+  ]
+}
+JSON
+BATCH_OUT="$(MEMORIA_HOME="$TMP_MEMORIA_HOME" "$ROOT_DIR/cli" sync "$BATCH_A_FILE" "$BATCH_B_FILE")"
+echo "$BATCH_OUT" | grep -q "已導入會話: session_batch_001" || { echo "batch sync output missing session_batch_001"; exit 1; }
+echo "$BATCH_OUT" | grep -q "已導入會話: session_batch_002" || { echo "batch sync output missing session_batch_002"; exit 1; }
+node - <<'NODE' "$TMP_MEMORIA_HOME/.memory/sessions.db"
+const Database = require('better-sqlite3')
+const db = new Database(process.argv[2], { readonly: true })
+for (const id of ['session_batch_001', 'session_batch_002']) {
+  if (!db.prepare('SELECT id FROM sessions WHERE id = ?').get(id)) throw new Error(`batch session missing from DB: ${id}`)
+}
+db.close()
+NODE
+BATCH_JSON="$(MEMORIA_HOME="$TMP_MEMORIA_HOME" "$ROOT_DIR/cli" sync "$BATCH_A_FILE" "$BATCH_B_FILE" --json)"
+SINGLE_JSON="$(MEMORIA_HOME="$TMP_MEMORIA_HOME" "$ROOT_DIR/cli" sync "$BATCH_A_FILE" --json)"
+node -e "
+const batch = JSON.parse(process.argv[1])
+const ids = batch.sessionIds ?? []
+if (ids.length !== 2 || !ids.includes('session_batch_001') || !ids.includes('session_batch_002')) {
+  throw new Error('multi-file --json should report both sessionIds, got: ' + JSON.stringify(batch))
+}
+const single = JSON.parse(process.argv[2])
+if (single.sessionId !== 'session_batch_001' || 'sessionIds' in single) {
+  throw new Error('single-file --json should keep the sessionId shape, got: ' + JSON.stringify(single))
+}
+" "$BATCH_JSON" "$SINGLE_JSON"
+
 echo "[smoke] quality guardrails"
 GUARDRAIL_FILE="$TMP_MEMORIA_HOME/guardrail-session.json"
 cat > "$GUARDRAIL_FILE" <<'JSON'
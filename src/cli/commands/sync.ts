@@ -7,25 +7,47 @@ export function registerSyncCommand(program: Command, paths: MemoriaPaths, core:
     program
         .command('sync')
         .description('Import session JSON and sync notes')
-        .argument('<sessionFile>', 'Path to session JSON file')
+        .argument('<sessionFiles...>', 'Path(s) to session JSON files')
         .option('--dry-run', 'Validate and preview without writing files')
         .option('--json', 'Machine-readable JSON output')
-        .action(async (sessionFile: string, options: { dryRun?: boolean; json?: boolean }) => {
-            const absSessionPath = path.resolve(sessionFile)
-            const sessionData = await readSession(absSessionPath)
+        .action(async (sessionFiles: string[], options: { dryRun?: boolean; json?: boolean }) => {
+            const absSessionPaths = sessionFiles.map((file) => path.resolve(file))
+            const sessions = []
+            for (const absSessionPath of absSessionPaths) {
+                sessions.push(await readSession(absSessionPath))
+            }
 
             if (options.dryRun) {
-                previewSync(paths, absSessionPath, sessionData)
+                for (const [index, absSessionPath] of absSessionPaths.entries()) {
+                    previewSync(paths, absSessionPath, sessions[index])
+                }
+                return
+            }
+
+            // Single file keeps the original remember() path and output; multiple files go
+            // through the bulk import so all sessions share one DB transaction + wiki rebuild.
+            if (sessions.length === 1) {
+                const result = await core.remember(sessions[0])
+                if (!result.ok) throw new Error(result.error)
+
+                if (options.json) {
+                    console.log(JSON.stringify({ ok: true, step: 'sync', sessionId: result.data?.sessionId, meta: result.meta }))
+                } else {
+                    console.log(`✓ 已導入會話: ${result.data?.sessionId}`)
+                    console.log('✅ 同步完成!')
+                }
                 return
             }
 
-            const result = await core.remember(sessionData)
+            const result = await core.rememberBatch(sessions)
             if (!result.ok) throw new Error(result.error)
 
             if (options.json) {
-                console.log(JSON.stringify({ ok: true, step: 'sync', sessionId: result.data?.sessionId, meta: result.meta }))
+                console.log(JSON.stringify({ ok: true, step: 'sync', sessionIds: result.data?.sessionIds, meta: result.meta }))
             } else {
-                console.log(`✓ 已導入會話: ${result.data?.sessionId}`)
+                for (const sessionId of result.data?.sessionIds ?? []) {
+                    console.log(`✓ 已導入會話: ${sessionId}`)
+                }
                 console.log('✅ 同步完成!')
             }
         })
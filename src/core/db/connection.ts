@@ -14,6 +14,17 @@ function poolKey(dbPath: string, readonly: boolean): string {
     return `${readonly ? 'ro' : 'rw'}:${dbPath}`
 }
 
+// WAL turns each commit into a sequential append and synchronous=NORMAL drops the per-commit
+// journal fsync (WAL stays durable across app crashes; only a power-loss can cost the last
+// commit, acceptable for a local memory store). journal_mode is persistent in the DB file, the
+// rest are per-connection. Write handles only — a readonly connection cannot switch journal
+// modes and never fsyncs.
+function applyConnectionPragmas(db: Database.Database): void {
+    db.pragma('journal_mode = WAL')
+    db.pragma('synchronous = NORMAL')
+    db.pragma('temp_store = MEMORY')
+}
+
 export function withDb<T>(dbPath: string, fn: (db: Database.Database) => T): T
 export function withDb<T>(dbPath: string, opts: WithDbOptions, fn: (db: Database.Database) => T): T
 export function withDb<T>(
@@ -30,6 +41,7 @@ export function withDb<T>(
     if (!db || !db.open) {
         // better-sqlite3 rejects `undefined` for these flags — coerce to boolean.
         db = new Database(dbPath, { readonly, fileMustExist: Boolean(opts.fileMustExist) })
+        if (!readonly) applyConnectionPragmas(db)
         pool.set(key, db)
     }
     return fn(db)
@@ -6,7 +6,7 @@
 // git_scan_runs: one row per sync; failures record the reason and never roll back observations
 // (spec §24 — each stage retries independently).
 
-import { createHash, randomUUID } from 'node:crypto'
+import { createHash, randomBytes } from 'node:crypto'
 import type Database from 'better-sqlite3'
 import { withDb } from './connection.js'
 import type { CommitInfo, GitRefSnapshot } from '../git/scanner.js'
@@ -48,7 +48,7 @@ function insertEventsTx(
     `)
     for (const event of events) {
         insert.run(
-            `ev_${randomUUID().replace(/-/g, '').slice(0, 16)}`,
+            `ev_${randomBytes(8).toString('hex')}`,
             repositoryId,
             worktreeId,
             event.eventType,
@@ -163,7 +163,7 @@ export function applyRefSnapshot(
             } else if (ref.refType !== 'head') {
                 newBranchCount += 1
             }
-            const id = `ref_${createHash('sha256').update(`${repositoryId}|${key}|${ref.commitSha}|${now}|${randomUUID()}`).digest('hex').slice(0, 16)}`
+            const id = `ref_${createHash('sha256').update(`${repositoryId}|${key}|${ref.commitSha}|${now}|${randomBytes(8).toString('hex')}`).digest('hex').slice(0, 16)}`
             insert.run(id, repositoryId, worktreeId, ref.refName, ref.refType, ref.commitSha, now)
         }
 
@@ -193,7 +193,7 @@ export function beginScanRun(
     previousHeadSha: string | null,
     currentHeadSha: string | null
 ): string {
-    const id = `scan_${randomUUID().replace(/-/g, '').slice(0, 16)}`
+    const id = `scan_${randomBytes(8).toString('hex')}`
     withDb(dbPath, (db) => {
         db.prepare(`
           INSERT INTO git_scan_runs
@@ -4,7 +4,7 @@
 // prompt_version) for summaries. Re-planning the same git state is a no-op; agent write-back
 // UPDATES the deterministic row in place instead of inserting a second summary.
 
-import { createHash, randomUUID } from 'node:crypto'
+import { createHash, randomBytes } from 'node:crypto'
 import { withDb } from './connection.js'
 import { parseJsonRecord } from './mappers.js'
 import type {
@@ -245,7 +245,7 @@ export function insertSummaryIfMissing(dbPath: string, input: InsertSummaryInput
             const range = db.prepare('SELECT * FROM git_summary_ranges WHERE id = ?').get(existing.summary_range_id) as RangeRow
             return { summary: mapSummary(existing, range), created: false }
         }
-        const id = `sum_${randomUUID().replace(/-/g, '').slice(0, 16)}`
+        const id = `sum_${randomBytes(8).toString('hex')}`
         const now = nowIso()
         const c = input.content
         db.prepare(`
@@ -1,5 +1,5 @@
 export { initDatabase } from './schema.js'
-export { importSession, listRecentSessions, querySessionSummary } from './session.js'
+export { importSession, importSessions, listRecentSessions, querySessionSummary } from './session.js'
 export { upsertSourceRecord, listSourceRecords } from './source.js'
 export {
     upsertWikiPage,
@@ -96,11 +96,15 @@ function pruneSkillsDuplicates(dbPath: string, dryRun: boolean): { duplicateGrou
         for (const [, list] of groups) {
             if (list.length <= 1) continue
             duplicateGroups += 1
+            // Keep the most-used duplicate: created_date is frozen at first learn while
+            // use_count accumulates across re-learns, so recency-first would delete the
+            // veteran skill in favour of a newer barely-used name variant. Recency only
+            // breaks use_count ties.
             list.sort((a, b) => {
-                const tDiff = parseCreatedAt(b.created_date) - parseCreatedAt(a.created_date)
-                if (tDiff !== 0) return tDiff
                 const uDiff = (b.use_count ?? 0) - (a.use_count ?? 0)
                 if (uDiff !== 0) return uDiff
+                const tDiff = parseCreatedAt(b.created_date) - parseCreatedAt(a.created_date)
+                if (tDiff !== 0) return tDiff
                 return a.id.localeCompare(b.id)
             })
             for (const row of list.slice(1)) deleteIds.push(row.id)
@@ -1,4 +1,5 @@
-import Database from 'better-sqlite3'
+import type Database from 'better-sqlite3'
+import { withDb } from './connection.js'
 
 type Migration = {
     id: number
@@ -462,9 +463,18 @@ function runMigrations(db: Database.Database): void {
     }
 }
 
+// Paths whose DDL + migrations already ran in this process. initDatabase is called on every
+// entrypoint that touches the DB (remember/recall/stats/…); the schema is idempotent but
+// re-parsing the full DDL script per call is pure overhead for long-lived callers like the
+// HTTP server. Process-lifetime cache, same assumption as the connection pool itself.
+const initializedPaths = new Set<string>()
+
 export function initDatabase(dbPath: string): void {
-    const db = new Database(dbPath)
-    try {
+    if (initializedPaths.has(dbPath)) return
+    // Runs on the pooled read-write connection (WAL pragmas applied there) instead of opening
+    // and closing a throwaway handle, so the page cache warmed by the DDL pass survives into
+    // the first real query.
+    withDb(dbPath, (db) => {
         db.exec(`
       CREATE TABLE IF NOT EXISTS sessions (
         id TEXT PRIMARY KEY,
@@ -901,7 +911,6 @@ export function initDatabase(dbPath: string): void {
     `)
 
         runMigrations(db)
-    } finally {
-        db.close()
-    }
+    })
+    initializedPaths.add(dbPath)
 }
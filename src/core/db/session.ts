@@ -1,48 +1,107 @@
+import type Database from 'better-sqlite3'
 import { existsSync } from '../paths.js'
-import { safeDate, deriveScope, resolveSessionId, resolveEventId, maybeParseJson, sanitizeSessionDataForImport } from '../utils.js'
+import { safeDate, safeIsoDate, deriveScope, resolveSessionId, resolveEventId, maybeParseJson, sanitizeSessionDataForImport } from '../utils.js'
 import { initDatabase } from './schema.js'
 import { withDb } from './connection.js'
 import type { Json, SessionData, RecentSessionRecord } from '../types.js'
 
-export function importSession(dbPath: string, sessionData: SessionData): string {
-    const nowIso = new Date().toISOString()
+// Pre-encoded defaults for absent event content/metadata: most events carry no metadata, so the
+// per-row JSON.stringify of a constant '' / {} was pure waste in large imports.
+const EMPTY_STRING_JSON = '""'
+const EMPTY_OBJECT_JSON = '{}'
+
+type SessionStatements = {
+    upsertSession: Database.Statement
+    upsertEvent: Database.Statement
+}
+
+function prepareSessionStatements(db: Database.Database): SessionStatements {
+    return {
+        upsertSession: db.prepare(`
+      INSERT OR REPLACE INTO sessions (id, timestamp, project, scope, event_count, summary)
+      VALUES (?, ?, ?, ?, ?, ?)
+    `),
+        upsertEvent: db.prepare(`
+      INSERT OR REPLACE INTO events (id, session_id, timestamp, event_type, content, metadata)
+      VALUES (?, ?, ?, ?, ?, ?)
+    `)
+    }
+}
+
+// Writes one sanitized session plus its events via the shared prepared statements. Callers wrap
+// this in a transaction (single-session import and bulk import share the same row logic).
+function writeSessionRows(stmts: SessionStatements, sessionData: SessionData, nowIso: string): string {
     const sanitized = sanitizeSessionDataForImport(sessionData)
     const sessionId = resolveSessionId(sanitized)
     const timestamp = safeDate(sanitized.timestamp).toISOString()
     const scope = deriveScope(sanitized)
     const events = sanitized.events ?? []
 
-    withDb(dbPath, (db) => {
-        const upsertSession = db.prepare(`
-      INSERT OR REPLACE INTO sessions (id, timestamp, project, scope, event_count, summary)
-      VALUES (?, ?, ?, ?, ?, ?)
-    `)
+    stmts.upsertSession.run(
+        sessionId,
+        timestamp,
+        sanitized.project ?? 'default',
+        scope,
+        events.length,
+        sanitized.summary ?? ''
+    )
 
-        upsertSession.run(
-            sessionId,
-            timestamp,
-            sanitized.project ?? 'default',
-            scope,
-            events.length,
-            sanitized.summary ?? ''
-        )
+    for (const [index, event] of events.entries()) {
+        const eventId = resolveEventId(event, sessionId, index)
+        const eventTime = safeIsoDate(event.timestamp ?? nowIso)
+        const eventType = event.type ?? event.event_type ?? 'UnknownEvent'
+        const content = event.content == null ? EMPTY_STRING_JSON : JSON.stringify(event.content)
+        const metadata = event.metadata == null ? EMPTY_OBJECT_JSON : JSON.stringify(event.metadata)
+        stmts.upsertEvent.run(eventId, sessionId, eventTime, eventType, content, metadata)
+    }
 
-        const upsertEvent = db.prepare(`
-      INSERT OR REPLACE INTO events (id, session_id, timestamp, event_type, content, metadata)
-      VALUES (?, ?, ?, ?, ?, ?)
-    `)
+    return sessionId
+}
 
-        for (const [index, event] of events.entries()) {
-            const eventId = resolveEventId(event, sessionId, index)
-            const eventTime = safeDate(event.timestamp ?? nowIso).toISOString()
-            const eventType = event.type ?? event.event_type ?? 'UnknownEvent'
-            const content = JSON.stringify(event.content ?? '')
-            const metadata = JSON.stringify(event.metadata ?? {})
-            upsertEvent.run(eventId, sessionId, eventTime, eventType, content, metadata)
-        }
+export function importSession(dbPath: string, sessionData: SessionData): string {
+    const nowIso = new Date().toISOString()
+    return withDb(dbPath, (db) => {
+        const stmts = prepareSessionStatements(db)
+        // One transaction for the session row plus all its events: a session with hundreds of
+        // events costs a single commit instead of one autocommit fsync per row, and the import
+        // stays all-or-nothing (no session row without its events after a crash).
+        return db.transaction(() => writeSessionRows(stmts, sessionData, nowIso))()
     })
+}
 
-    return sessionId
+// Cap on how many event rows one bulk-import transaction accumulates before committing. Whole
+// sessions are grouped until the batch passes this, so a huge import stays a handful of group
+// commits while the WAL / dirty-page set stays bounded instead of growing with the full input.
+const BULK_IMPORT_EVENT_CHUNK = 5000
+
+// Bulk import: all sessions ride one connection and one pair of prepared statements, grouped
+// into chunked transactions (see BULK_IMPORT_EVENT_CHUNK; a session is never split across two).
+// Returns session ids in input order for the caller's per-session follow-up (daily note /
+// decision / skill sync).
+export function importSessions(dbPath: string, sessions: SessionData[]): string[] {
+    if (sessions.length === 0) return []
+    const nowIso = new Date().toISOString()
+    return withDb(dbPath, (db) => {
+        const stmts = prepareSessionStatements(db)
+        const runBatch = db.transaction((batch: SessionData[]) =>
+            batch.map((session) => writeSessionRows(stmts, session, nowIso))
+        )
+
+        const sessionIds: string[] = []
+        let batch: SessionData[] = []
+        let batchEventCount = 0
+        for (const session of sessions) {
+            batch.push(session)
+            batchEventCount += session.events?.length ?? 0
+            if (batchEventCount >= BULK_IMPORT_EVENT_CHUNK) {
+                sessionIds.push(...runBatch(batch))
+                batch = []
+                batchEventCount = 0
+            }
+        }
+        if (batch.length > 0) sessionIds.push(...runBatch(batch))
+        return sessionIds
+    })
 }
 
 export function listRecentSessions(dbPath: string, limitRaw = 10): RecentSessionRecord[] {
@@ -74,13 +133,14 @@ export function querySessionSummary(
 
         if (!session) return null
 
-        const decisionEvents = db
-            .prepare(`SELECT id, content FROM events WHERE session_id = ? AND event_type = 'DecisionMade'`)
-            .all(sessionId) as { id: string; content: string }[]
+        // One index range scan for both event kinds, bucketed here, instead of two separate
+        // filtered walks of the same (session_id, event_type) index.
+        const eventRows = db
+            .prepare(`SELECT id, event_type, content FROM events WHERE session_id = ? AND event_type IN ('DecisionMade', 'SkillLearned')`)
+            .all(sessionId) as { id: string; event_type: string; content: string }[]
 
-        const skillEvents = db
-            .prepare(`SELECT id, content FROM events WHERE session_id = ? AND event_type = 'SkillLearned'`)
-            .all(sessionId) as { id: string; content: string }[]
+        const decisionEvents = eventRows.filter((row) => row.event_type === 'DecisionMade')
+        const skillEvents = eventRows.filter((row) => row.event_type === 'SkillLearned')
 
         const decisions = decisionEvents.map((row) => {
             const c = maybeParseJson(row.content)
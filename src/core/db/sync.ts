@@ -1,10 +1,65 @@
 import fs from 'node:fs/promises'
 import path from 'node:path'
-import { existsSync } from '../paths.js'
-import { safeDate, slugify } from '../utils.js'
+import { safeIsoDate, slugify } from '../utils.js'
 import { parseDecisionEvent, parseSkillEvent } from '../extract.js'
+import type { DecisionFields, SkillFields } from '../extract.js'
 import { withDb } from './connection.js'
 
+// Markdown templates for the extracted documents, hoisted to module scope so the row loops just
+// fill in fields instead of rebuilding the whole template expression per row.
+
+function formatDecisionDoc(fields: DecisionFields, timestamp: string, sessionId: string, date: string): string {
+    const alternatives = fields.alternatives.length > 0
+        ? fields.alternatives.map((a) => `- ${a}`).join('\n')
+        : '- (none)'
+
+    return `# ${fields.title}
+
+## 元數據
+- **日期**: ${timestamp}
+- **Session ID**: \`${sessionId}\`
+
+## 決策內容
+${fields.decision}
+
+## 理由
+${fields.rationale}
+
+## 考慮的替代方案
+${alternatives}
+
+## 影響等級
+${fields.impact_level}
+
+## 相關連結
+[[${date}]]
+`
+}
+
+function formatSkillDoc(fields: SkillFields, timestamp: string, date: string, useCount: number): string {
+    const examples = fields.examples.length > 0
+        ? fields.examples.map((e) => `- ${e}`).join('\n')
+        : '- (none)'
+
+    return `# ${fields.title}
+
+## 元數據
+- **創建日期**: ${timestamp}
+- **類別**: ${fields.category}
+- **成功率**: ${(fields.success_rate * 100).toFixed(1)}%
+- **使用次數**: ${useCount}
+
+## 模式描述
+${fields.pattern}
+
+## 實際案例
+${examples}
+
+## 版本歷史
+- v1.0 (${date}): 初始版本
+`
+}
+
 export async function syncDailyNote(memoriaHome: string, dbPath: string, sessionId: string): Promise<void> {
     return withDb(dbPath, { readonly: true }, async (db) => {
         const row = db
@@ -13,20 +68,22 @@ export async function syncDailyNote(memoriaHome: string, dbPath: string, session
 
         if (!row) return
 
-        const d = safeDate(row.timestamp)
-        const date = d.toISOString().slice(0, 10)
-        const time = d.toISOString().slice(11, 16)
+        const iso = safeIsoDate(row.timestamp)
+        const date = iso.slice(0, 10)
+        const time = iso.slice(11, 16)
         const notePath = path.join(memoriaHome, 'knowledge', 'Daily', `${date}.md`)
 
         const newEntry = `\n## ${time} - ${row.project}\n\n${row.summary ?? ''}\n\n事件數: ${row.event_count} | Session ID: \`${sessionId}\`\n`
 
-        let content = `# ${date}\n\n${newEntry}`
-        if (existsSync(notePath)) {
-            const oldContent = await fs.readFile(notePath, 'utf8')
-            content = `${oldContent}${newEntry}`
+        // Entries only ever go at the end of the note, so write just the delta instead of
+        // re-reading and rewriting the whole file (which cost O(note size) per sync on a busy
+        // day). 'wx' creates the note with its header exactly once; EEXIST means append.
+        try {
+            await fs.writeFile(notePath, `# ${date}\n\n${newEntry}`, { encoding: 'utf8', flag: 'wx' })
+        } catch (error) {
+            if ((error as NodeJS.ErrnoException).code !== 'EEXIST') throw error
+            await fs.appendFile(notePath, newEntry, 'utf8')
         }
-
-        await fs.writeFile(notePath, content, 'utf8')
     })
 }
 
@@ -40,41 +97,22 @@ export async function extractDecisions(memoriaHome: string, dbPath: string, sess
       `)
             .all(sessionId) as { id: string; timestamp: string; content: string }[]
 
+        // Queue the writes and await them together: a session with many decisions overlaps the
+        // per-file fs latency instead of paying it serially (each file has a distinct name, so
+        // ordering between them does not matter).
+        const writes: Promise<void>[] = []
         for (const row of rows) {
             const fields = parseDecisionEvent(row.content)
 
-            const date = safeDate(row.timestamp).toISOString().slice(0, 10)
+            const date = safeIsoDate(row.timestamp).slice(0, 10)
             const filename = `${date}_${slugify(fields.title).slice(0, 40)}_${slugify(row.id).slice(0, 8)}.md`
             const filePath = path.join(memoriaHome, 'knowledge', 'Decisions', filename)
 
-            const alternatives = fields.alternatives.length > 0
-                ? fields.alternatives.map((a) => `- ${a}`).join('\n')
-                : '- (none)'
+            const decisionDoc = formatDecisionDoc(fields, row.timestamp, sessionId, date)
 
-            const decisionDoc = `# ${fields.title}
-
-## 元數據
-- **日期**: ${row.timestamp}
-- **Session ID**: \`${sessionId}\`
-
-## 決策內容
-${fields.decision}
-
-## 理由
-${fields.rationale}
-
-## 考慮的替代方案
-${alternatives}
-
-## 影響等級
-${fields.impact_level}
-
-## 相關連結
-[[${date}]]
-`
-
-            await fs.writeFile(filePath, decisionDoc, 'utf8')
+            writes.push(fs.writeFile(filePath, decisionDoc, 'utf8'))
         }
+        await Promise.all(writes)
     })
 }
 
@@ -88,52 +126,53 @@ export async function extractSkills(memoriaHome: string, dbPath: string, session
       `)
             .all(sessionId) as { id: string; timestamp: string; content: string }[]
 
+        // True upsert instead of INSERT OR REPLACE (which is DELETE + INSERT under the hood):
+        // re-learning a skill now keeps its original created_date and increments use_count
+        // rather than resetting both, and SQLite skips the row-deletion round trip.
         const upsertSkill = db.prepare(`
-      INSERT OR REPLACE INTO skills
+      INSERT INTO skills
       (id, name, category, created_date, success_rate, use_count, filepath)
-      VALUES (?, ?, ?, ?, ?, ?, ?)
+      VALUES (?, ?, ?, ?, ?, 1, ?)
+      ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        category = excluded.category,
+        success_rate = excluded.success_rate,
+        use_count = skills.use_count + 1,
+        filepath = excluded.filepath
+      RETURNING use_count
     `)
 
-        for (const row of rows) {
+        const parsed = rows.map((row) => {
             const fields = parseSkillEvent(row.content)
-            const date = safeDate(row.timestamp).toISOString().slice(0, 10)
-
-            const filename = `${slugify(fields.title)}.md`
-            const filePath = path.join(memoriaHome, 'knowledge', 'Skills', filename)
-
-            const examples = fields.examples.length > 0
-                ? fields.examples.map((e) => `- ${e}`).join('\n')
-                : '- (none)'
-
-            const skillDoc = `# ${fields.title}
-
-## 元數據
-- **創建日期**: ${row.timestamp}
-- **類別**: ${fields.category}
-- **成功率**: ${(fields.success_rate * 100).toFixed(1)}%
-- **使用次數**: 1
-
-## 模式描述
-${fields.pattern}
-
-## 實際案例
-${examples}
-
-## 版本歷史
-- v1.0 (${date}): 初始版本
-`
-
-            await fs.writeFile(filePath, skillDoc, 'utf8')
-
-            upsertSkill.run(
-                slugify(fields.title).toLowerCase(),
-                fields.title,
-                fields.category,
-                row.timestamp,
-                fields.success_rate,
-                1,
-                filePath
-            )
-        }
+            const date = safeIsoDate(row.timestamp).slice(0, 10)
+            const filePath = path.join(memoriaHome, 'knowledge', 'Skills', `${slugify(fields.title)}.md`)
+            return { fields, timestamp: row.timestamp, date, filePath }
+        })
+
+        // All skill upserts land in one transaction: a single WAL commit at the end instead of
+        // one autocommit fsync per skill. RETURNING hands back the accumulated use_count so the
+        // markdown below renders the real post-upsert total, not a hardcoded 1.
+        const useCounts = db.transaction(() =>
+            parsed.map((skill) => (upsertSkill.get(
+                slugify(skill.fields.title).toLowerCase(),
+                skill.fields.title,
+                skill.fields.category,
+                skill.timestamp,
+                skill.fields.success_rate,
+                skill.filePath
+            ) as { use_count: number }).use_count)
+        )()
+
+        // Keyed by path because re-learned skills share a filename: last row wins (and carries
+        // the highest use_count), exactly as the old sequential writes behaved, and the deduped
+        // batch then writes in parallel.
+        const pendingDocs = new Map<string, string>()
+        parsed.forEach((skill, index) => {
+            pendingDocs.set(skill.filePath, formatSkillDoc(skill.fields, skill.timestamp, skill.date, useCounts[index]))
+        })
+
+        await Promise.all(
+            Array.from(pendingDocs, ([filePath, doc]) => fs.writeFile(filePath, doc, 'utf8'))
+        )
     })
 }
@@ -23,6 +23,7 @@ export {
 export {
     initDatabase,
     importSession,
+    importSessions,
     syncDailyNote,
     extractDecisions,
     extractSkills,
@@ -74,7 +75,7 @@ export {
     RELEASE_TAG_PATTERN
 } from './git/summary-pipeline.js'
 export {
-    safeDate, slugify, stableStringify, shortHash, deriveScope,
+    safeDate, safeIsoDate, slugify, stableStringify, shortHash, deriveScope,
     resolveSessionId, resolveEventId,
     getEventType, getEventContentObject,
     maybeParseJson, normalizeSkillKey,
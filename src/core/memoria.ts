@@ -8,6 +8,7 @@ import { existsSync } from './paths.js'
 import {
     initDatabase,
     importSession,
+    importSessions,
     syncDailyNote,
     extractDecisions,
     extractSkills,
@@ -181,13 +182,29 @@ async function withResult<T>(
 export class MemoriaCore {
     readonly paths: MemoriaPaths
 
+    private initPromise?: Promise<void>
+
     constructor(paths: MemoriaPaths) {
         this.paths = paths
     }
 
     // ─── Init ────────────────────────────────────────────────────────────────
 
+    // Every public entrypoint awaits init(), but the mkdir fan-out and schema check only need
+    // to run once per core instance — cache the first run so repeat calls (each HTTP request,
+    // back-to-back CLI steps) skip the ~11 mkdir syscalls. Concurrent callers share the same
+    // in-flight promise; a failed run clears the cache so the next call retries.
     async init(): Promise<void> {
+        if (!this.initPromise) {
+            this.initPromise = this.runInit().catch((error) => {
+                this.initPromise = undefined
+                throw error
+            })
+        }
+        return this.initPromise
+    }
+
+    private async runInit(): Promise<void> {
         const dirs = [
             this.paths.memoryDir,
             this.paths.sessionsPath,
@@ -298,6 +315,41 @@ export class MemoriaCore {
         })
     }
 
+    // Bulk form of remember(): sessions import through a few chunked group-commit transactions
+    // (see importSessions) and the compiled wiki rebuilds once at the end, instead of one commit
+    // and one wiki pass per session file. Markdown/index follow-up still runs per session.
+    async rememberBatch(sessions: SessionData[]): Promise<MemoriaResult<{ sessionIds: string[] }>> {
+        return withResult('sqlite', async () => {
+            await this.init()
+            const sessionIds = importSessions(this.paths.dbPath, sessions)
+            for (const [index, sessionId] of sessionIds.entries()) {
+                await syncDailyNote(this.paths.memoriaHome, this.paths.dbPath, sessionId)
+                await extractDecisions(this.paths.memoriaHome, this.paths.dbPath, sessionId)
+                await extractSkills(this.paths.memoriaHome, this.paths.dbPath, sessionId)
+
+                if (process.env.MEMORIA_INDEX_AUTOBUILD !== '0') {
+                    try {
+                        buildMemoryIndex(this.paths.dbPath, {
+                            sessionId,
+                            project: sessions[index]?.project,
+                            scope: sessions[index]?.scope
+                        })
+                    } catch {
+                        // Keep rememberBatch() fail-open for indexing errors.
+                    }
+                }
+            }
+
+            try {
+                await buildCompiledWiki(this.paths)
+            } catch {
+                // Keep rememberBatch() fail-open for wiki build errors.
+            }
+
+            return { data: { sessionIds }, evidence: sessionIds, confidence: 1.0 }
+        })
+    }
+
     // ─── recall() ────────────────────────────────────────────────────────────
 
     async recall(filter: RecallFilter): Promise<MemoriaResult<RecallHit[]>> {
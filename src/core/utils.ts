@@ -9,6 +9,24 @@ export function safeDate(raw?: string): Date {
     return Number.isNaN(d.getTime()) ? new Date() : d
 }
 
+// Last-value cache over safeDate(...).toISOString(): the import/extract loops convert the same
+// timestamp string row after row (events in a session usually share one timestamp), so remember
+// the most recent successful conversion instead of re-parsing per row. Missing or unparseable
+// input still resolves to a fresh "now" every call, exactly like safeDate.
+let lastIsoDateInput: string | undefined
+let lastIsoDateOutput = ''
+
+export function safeIsoDate(raw?: string): string {
+    if (raw !== undefined && raw === lastIsoDateInput) return lastIsoDateOutput
+    const d = raw ? new Date(raw) : new Date()
+    if (raw && !Number.isNaN(d.getTime())) {
+        lastIsoDateInput = raw
+        lastIsoDateOutput = d.toISOString()
+        return lastIsoDateOutput
+    }
+    return (Number.isNaN(d.getTime()) ? new Date() : d).toISOString()
+}
+
 // Word-token pattern for recall/telemetry tokenization: ASCII alphanumerics plus CJK
 // unified ideographs (U+4E00–U+9FFF); everything else is a delimiter.
 //
@@ -124,12 +142,18 @@ export function buildCalibration(
     return { scoredQueries, buckets, monotonic }
 }
 
+// slugify patterns, hoisted like TOKEN_SPLIT_PATTERN so the hot extract loops (one slugify per
+// decision/skill filename) reuse compiled regexes. Bad filename chars, whitespace, and existing
+// underscores share one class: a run of any mix of them collapses to a single '_' in one scan,
+// which is exactly what the previous three passes (bad-char sub, whitespace sub, underscore-run
+// collapse) produced in three.
+const SLUG_COLLAPSE_RUNS = /[<>:"/\\|?*\x00-\x1F\s_]+/g
+const SLUG_EDGE_UNDERSCORES = /^_+|_+$/g
+
 export function slugify(input: string): string {
     const cleaned = input
-        .replace(/[<>:"/\\|?*\x00-\x1F]/g, '_')
-        .replace(/\s+/g, '_')
-        .replace(/_+/g, '_')
-        .replace(/^_+|_+$/g, '')
+        .replace(SLUG_COLLAPSE_RUNS, '_')
+        .replace(SLUG_EDGE_UNDERSCORES, '')
     return cleaned || 'untitled'
 }
 
@@ -208,7 +232,15 @@ export function getEventContentObject(event: SessionEvent): Json {
     return {}
 }
 
+// Chars a JSON value can start with (after leading whitespace): object, array, string, number,
+// true/false/null. Anything else cannot parse, so skip the attempt entirely — callers feed this
+// plain prose constantly (e.g. session summaries in the recall path), and a thrown-and-caught
+// SyntaxError per row is far more expensive than this one-char sniff.
+const JSON_START_CHARS = new Set('{["-0123456789tfn')
+
 export function maybeParseJson(raw: string): unknown {
+    const first = raw.trimStart().charAt(0)
+    if (!JSON_START_CHARS.has(first)) return raw
     try {
         return JSON.parse(raw)
     } catch {